@@ -0,0 +1,59 @@
+'''
+Gunicorn configuration for the backend API.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:application
+'''
+import os
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+
+# Threaded workers by default so requests waiting on PostgreSQL don't block
+# each other. psycopg2 releases the GIL while waiting on the server, so
+# raising GUNICORN_THREADS lets each worker keep more queries in flight; keep
+# it at or below the per-worker connection pool size.
+#
+# GUNICORN_WORKER_CLASS=gevent instead serves each request on a greenlet,
+# with psycogreen making psycopg2 yield while it waits on the database.
+# Requests beyond DB_POOL_MAXCONN queue for a free connection.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('GUNICORN_WORKERS', 2 * multiprocessing.cpu_count() + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# gthread workers fork from a master that has imported the app once
+# (copy-on-write). gevent workers import it themselves, after gunicorn's gevent
+# worker has monkey-patched the process: the locks, queues and thread pool the
+# app modules create at import would otherwise be real OS-level objects that
+# block the whole hub.
+preload_app = worker_class != 'gevent'
+
+
+def post_fork(server, worker):
+    # gunicorn's gevent worker monkey-patches itself after the fork; psycopg2
+    # additionally needs a wait callback so its queries yield to other greenlets
+    if worker_class == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+
+def post_worker_init(worker):
+    # Without preloading, the master never imports the app, so the startup
+    # database check runs in the first worker instead (age counts spawns)
+    if not preload_app and worker.age == 1:
+        from main import log_database_status
+        log_database_status()
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+
+    import database as db
+    from main import log_database_status
+
+    # Run the startup database check once in the master, then close its
+    # connections before forking so every worker opens its own pool
+    log_database_status()
+    db.close_pool()
@@ -1,22 +1,151 @@
-from flask import Flask, jsonify, request
+import csv
+import io
+import hashlib
+import threading
+import time
+from functools import wraps
+import orjson
+from cachetools import LRUCache
+from flask import Flask, Response, jsonify, make_response, request, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 import database as db
 
+
+class OrjsonProvider(JSONProvider):
+    '''JSON provider backed by orjson, which serializes datetimes natively and much faster.'''
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-print('Checking database connection...')
-if db.check_database_connection():
-    print('✓ Database connection successful!')
-    stats = db.get_database_stats()
-    print(f'✓ Database has {stats["total_events"]} events and {stats["total_organizations"]} organizations')
-else:
-    print('✗ Warning: Database connection failed!')
-    print('  Make sure PostgreSQL is running and DATABASE_URL is set correctly')
+# Compress JSON responses (event pages with descriptions run to tens of KB),
+# preferring brotli and falling back to gzip; tiny bodies are left as-is
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
+
+def log_database_status():
+    '''
+    Print whether the database is reachable and how much data it holds.
+    Called once at server startup rather than at import, so importing the
+    app (WSGI workers, scripts) does no database work.
+    '''
+    print('Checking database connection...')
+    if db.check_database_connection():
+        print('✓ Database connection successful!')
+        stats = db.get_database_stats()
+        print(f'✓ Database has {stats["total_events"]} events and {stats["total_organizations"]} organizations')
+    else:
+        print('✗ Warning: Database connection failed!')
+        print('  Make sure PostgreSQL is running and DATABASE_URL is set correctly')
+
+
+def cache_headers(max_age=None, stale_while_revalidate=None):
+    '''
+    Decorator for read-only endpoints that adds an ETag and Cache-Control header
+    to successful responses and answers matching If-None-Match requests with 304.
+
+    Without max_age the response is sent as no-cache: clients keep it but
+    revalidate on every use, getting a cheap 304 while the ETag still matches.
+    That is the right mode for anything the app's own writes can change.
+
+    Args:
+        max_age (int): Seconds clients may reuse the response without
+            revalidating; only for data that is effectively static
+        stale_while_revalidate (int): Optional seconds past max_age that caches
+            may keep serving the stale response while revalidating it
+    '''
+    if max_age is None:
+        cache_control = 'no-cache'
+    else:
+        cache_control = f'public, max-age={max_age}'
+        if stale_while_revalidate:
+            cache_control += f', stale-while-revalidate={stale_while_revalidate}'
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            etag = hashlib.md5(response.get_data()).hexdigest()
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = cache_control
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+# Serialized bodies of the event pages database.py currently has cached,
+# keyed on the page object itself: the cache hands back the same dict until
+# the entry expires or is invalidated, and a new dict means a new body. Each
+# entry keeps its page alive, so its id() cannot be reused while it is here.
+_page_bodies = LRUCache(maxsize=128)
+_page_bodies_lock = threading.Lock()
+
+
+def json_page_response(result):
+    '''
+    Build a JSON response for an events page, serializing each page object once.
+
+    Args:
+        result (dict): Page returned by db.get_events_paginated
+
+    Returns:
+        Response: application/json response
+    '''
+    with _page_bodies_lock:
+        entry = _page_bodies.get(id(result))
+    if entry is not None and entry[0] is result:
+        body = entry[1]
+    else:
+        body = orjson.dumps(result, option=orjson.OPT_NAIVE_UTC)
+        with _page_bodies_lock:
+            _page_bodies[id(result)] = (result, body)
+    return Response(body, mimetype='application/json')
+
+
+def multi_value_arg(name):
+    '''
+    Read a multi-value query parameter given either repeated (?name=a&name=b)
+    or comma-separated (?name=a,b).
+
+    Args:
+        name (str): Query parameter name
+
+    Returns:
+        list: Non-empty values, or None if the parameter was not given
+    '''
+    values = [value.strip() for raw in request.args.getlist(name) for value in raw.split(',')]
+    return [value for value in values if value] or None
+
+
+# Last /api/health result, reused for a few seconds so frequent probes do
+# not each run a connection check and the stats query
+_HEALTH_TTL = 5
+_health_cache = {'checked_at': 0.0, 'response': None}
+_health_lock = threading.Lock()
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    '''Health check endpoint with database status.'''
+    '''Health check endpoint with database status (cached for a few seconds).'''
+    with _health_lock:
+        if (_health_cache['response'] is not None
+                and time.monotonic() - _health_cache['checked_at'] < _HEALTH_TTL):
+            return jsonify(_health_cache['response'])
+
     db_connected = db.check_database_connection()
 
     response = {
@@ -33,22 +162,34 @@ def health_check():
             response['database'] = 'error'
             response['error'] = str(e)
 
+    with _health_lock:
+        _health_cache['checked_at'] = time.monotonic()
+        _health_cache['response'] = response
+
     return jsonify(response)
 
+
+@app.route('/api/health/live', methods=['GET'])
+def liveness_check():
+    '''Liveness probe: reports that the process is serving requests, without touching the database.'''
+    return jsonify({'status': 'alive'})
+
 @app.route('/api/events', methods=['GET'])
+@cache_headers()
 def get_events():
     '''
     Get paginated events from database.
 
     Query parameters:
         - page: Page number (default: 1)
+        - after: Cursor from a previous response's next_cursor (optional, replaces page)
         - limit: Events per page (default: 20, max: 100)
-        - category: Filter by category (optional, can be comma-separated list)
+        - category: Filter by category (optional, repeatable or comma-separated list)
         - search: Search in event names (optional)
         - event_type: Filter by event type (in_person, online, hybrid) (optional)
         - start_date: Filter events after this date (ISO format) (optional)
         - end_date: Filter events before this date (ISO format) (optional)
-        - organization: Filter by organization ID (optional, can be comma-separated list)
+        - organization: Filter by organization ID (optional, repeatable or comma-separated list)
     '''
     try:
         page = request.args.get('page', 1, type=int)
@@ -58,15 +199,20 @@ def get_events():
         start_date = request.args.get('start_date', None, type=str)
         end_date = request.args.get('end_date', None, type=str)
 
-        # Handle comma-separated categories
-        category = request.args.get('category', None, type=str)
-        if category:
-            category = [c.strip() for c in category.split(',')]
+        # Decode keyset cursor from a previous page
+        after_datetime = after_event_id = None
+        after = request.args.get('after', None, type=str)
+        if after:
+            try:
+                after_datetime, after_event_id = db.decode_cursor(after)
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Validation error',
+                    'message': str(e)
+                }), 400
 
-        # Handle comma-separated organizations
-        organization = request.args.get('organization', None, type=str)
-        if organization:
-            organization = [o.strip() for o in organization.split(',')]
+        category = multi_value_arg('category')
+        organization = multi_value_arg('organization')
 
         result = db.get_events_paginated(
             page=page,
@@ -76,10 +222,12 @@ def get_events():
             event_type=event_type,
             start_date=start_date,
             end_date=end_date,
-            organization=organization
+            organization=organization,
+            after_datetime=after_datetime,
+            after_event_id=after_event_id
         )
 
-        return jsonify(result)
+        return json_page_response(result)
 
     except Exception as e:
         return jsonify({
@@ -87,7 +235,36 @@ def get_events():
             'message': str(e)
         }), 500
 
+@app.route('/api/events/export', methods=['GET'])
+def export_events():
+    '''Export all events as a CSV file, streamed row by row from the database.'''
+    columns = [
+        'event_id', 'event_name', 'event_start_datetime', 'event_end_datetime',
+        'category', 'location_text', 'online_link', 'event_type', 'attendees',
+        'price_range', 'event_url', 'org_id', 'org_name'
+    ]
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        writer.writeheader()
+        for event in db.stream_events_export():
+            writer.writerow(event)
+            if buffer.tell() > 65536:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=events.csv'}
+    )
+
+
 @app.route('/api/events/<event_id>', methods=['GET'])
+@cache_headers()
 def get_event_by_id(event_id):
     '''Get a single event by its ID.'''
     try:
@@ -109,6 +286,7 @@ def get_event_by_id(event_id):
 
 
 @app.route('/api/categories', methods=['GET'])
+@cache_headers(max_age=300, stale_while_revalidate=60)
 def get_categories():
     '''Get all unique event categories.'''
     try:
@@ -126,6 +304,7 @@ def get_categories():
 
 
 @app.route('/api/organizations', methods=['GET'])
+@cache_headers()
 def get_organizations():
     '''
     Get all organizations with optional stats.
@@ -251,6 +430,7 @@ def delete_event(event_id):
 
 
 @app.route('/api/stats', methods=['GET'])
+@cache_headers()
 def get_stats():
     '''Get database statistics.'''
     try:
@@ -281,4 +461,6 @@ def post_example():
     }), 201
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    log_database_status()
+    # Debug mode (reloader and debugger) follows FLASK_DEBUG
+    app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import Future
+
+
+class Group:
+    '''
+    Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers that arrive while
+    it is still running block on the same Future and receive its result (or
+    its exception) instead of repeating the work.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        '''
+        Run fn(*args, **kwargs) unless a call for key is already in flight.
+
+        Args:
+            key: Hashable key identifying equivalent calls
+            fn (callable): Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The return value of fn, shared by every caller for key
+        '''
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return future.result()
@@ -27,6 +27,15 @@ if [ $RETRY_COUNT -eq $MAX_RETRIES ]; then
     exit 1
 fi
 
+echo ""
+echo "Applying database migrations..."
+for MIGRATION in /database/migrations/*.sql; do
+    [ -f "$MIGRATION" ] || continue
+    echo "  → $(basename "$MIGRATION")"
+    psql $DATABASE_URL -q -v ON_ERROR_STOP=1 -f "$MIGRATION"
+done
+echo "✓ Migrations applied"
+
 echo ""
 echo "Checking if database needs to be populated..."
 
@@ -50,7 +59,7 @@ else
     if [ "$EVENT_COUNT" = "0" ]; then
         echo ""
         echo "Database is empty. Loading event data automatically..."
-        python /database/load_data.py
+        python /database/load_data.py --bulk
         echo ""
         echo "✓ Event data loaded successfully!"
 
@@ -79,4 +88,9 @@ echo "Starting Flask application..."
 echo "==================================================="
 echo ""
 
-exec python main.py
+# Development uses the Flask server for hot reload, otherwise run gunicorn
+if [ "$FLASK_DEBUG" = "1" ]; then
+    exec python main.py
+else
+    exec gunicorn -c gunicorn.conf.py wsgi:application
+fi
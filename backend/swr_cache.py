@@ -0,0 +1,99 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache
+
+from singleflight import Group
+
+
+class StaleWhileRevalidateCache:
+    '''
+    Cache that keeps serving an expired value while it is refreshed.
+
+    Entries younger than ttl are returned as-is. Entries older than ttl but
+    within ttl + stale_window are still returned immediately, and a single
+    background refresh per key is scheduled to replace them. Missing or
+    fully expired entries are computed in the calling thread, with
+    concurrent callers for the same key sharing one computation.
+    '''
+
+    def __init__(self, ttl, stale_window, maxsize=256, max_workers=2):
+        '''
+        Args:
+            ttl (float): Seconds an entry is considered fresh
+            stale_window (float): Seconds after ttl a stale entry may still be served
+            maxsize (int): Maximum number of keys kept (least recently used evicted)
+            max_workers (int): Threads available for background refreshes
+        '''
+        self.ttl = ttl
+        self.stale_window = stale_window
+        self._entries = LRUCache(maxsize=maxsize)
+        self._refreshing = set()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._flight = Group()
+        # Created on the first refresh, i.e. in the process (and, under
+        # gevent, after the monkey-patching) that actually serves requests
+        self._max_workers = max_workers
+        self._executor = None
+
+    def get(self, key, fn, *args):
+        '''
+        Return the cached value for key, computing it with fn(*args) if needed.
+
+        Args:
+            key: Hashable cache key
+            fn (callable): Function that computes the value
+            *args: Positional arguments for fn
+
+        Returns:
+            The cached or freshly computed value
+        '''
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, cached_at = entry
+                age = now - cached_at
+                if age < self.ttl:
+                    return value
+                if age < self.ttl + self.stale_window:
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        if self._executor is None:
+                            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                                thread_name_prefix='swr-refresh')
+                        self._executor.submit(self._refresh, key, self._generation, fn, args)
+                    return value
+
+        return self._flight.do(key, self._load, key, fn, args)
+
+    def clear(self):
+        '''Drop every entry; refreshes already running will not store their result.'''
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _load(self, key, fn, args):
+        with self._lock:
+            generation = self._generation
+        value = fn(*args)
+        self._store(key, generation, value)
+        return value
+
+    def _refresh(self, key, generation, fn, args):
+        try:
+            self._store(key, generation, fn(*args))
+        except Exception as e:
+            # Keep serving the stale value; the next request past ttl retries
+            print(f'✗ Background cache refresh failed for {key!r}: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key, generation, value):
+        with self._lock:
+            # A clear() since the computation started means the value may
+            # predate a write, so it is returned but not cached
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic())
@@ -0,0 +1,7 @@
+'''
+WSGI entry point for production servers.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:application
+'''
+from main import app as application
@@ -0,0 +1,81 @@
+'''
+COPY-based bulk upsert shared by the database loading scripts.
+'''
+
+import io
+import csv
+
+
+def _text_field(value):
+    '''Format one value for PostgreSQL's text COPY format (\\N is NULL).'''
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _write_rows(buffer, rows, copy_format):
+    # Each row is followed by its position, which orders the deduplication
+    if copy_format == 'csv':
+        writer = csv.writer(buffer)
+        for position, row in enumerate(rows):
+            writer.writerow((*row, position))
+    elif copy_format == 'text':
+        for position, row in enumerate(rows):
+            buffer.write('\t'.join(map(_text_field, row)))
+            buffer.write(f'\t{position}\n')
+    else:
+        raise ValueError(f'Unsupported COPY format: {copy_format!r}')
+
+
+def copy_upsert(cursor, table, columns, rows, conflict_columns, update_columns,
+                extra_updates=(), copy_format='text'):
+    '''
+    Bulk upsert rows by COPYing them into a temporary staging table and
+    merging that into the target table with a single INSERT ... ON CONFLICT.
+
+    Rows repeating a key are deduplicated in the merge, the last one winning,
+    since ON CONFLICT cannot update the same row twice in one statement. The
+    staging table lasts until the caller commits and is reused by later calls
+    in the same transaction.
+
+    Args:
+        cursor: Database cursor
+        table (str): Target table name
+        columns (tuple): Column names, in the order the row tuples use
+        rows (iterable): Row tuples to upsert
+        conflict_columns (tuple): Columns of the unique key to upsert on
+        update_columns (tuple): Columns to overwrite when a row already exists
+        extra_updates (tuple): Additional SET assignments for existing rows
+        copy_format (str): 'text' (None becomes \\N) or 'csv' (None becomes an
+            empty field, as csv.writer writes it)
+
+    Returns:
+        int: Number of rows inserted or updated
+    '''
+    buffer = io.StringIO()
+    _write_rows(buffer, rows, copy_format)
+    buffer.seek(0)
+
+    stage = f'{table}_stage'
+    column_list = ', '.join(columns)
+    conflict_list = ', '.join(conflict_columns)
+    updates = ', '.join([f'{col} = EXCLUDED.{col}' for col in update_columns] + list(extra_updates))
+
+    cursor.execute(f'''
+        CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DROP AS
+        SELECT {column_list}, 0::bigint AS stage_position FROM {table} WITH NO DATA
+    ''')
+    cursor.copy_expert(
+        f'COPY {stage} ({column_list}, stage_position) FROM STDIN WITH (FORMAT {copy_format})',
+        buffer
+    )
+    cursor.execute(f'''
+        INSERT INTO {table} ({column_list})
+        SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {stage}
+        ORDER BY {conflict_list}, stage_position DESC
+        ON CONFLICT ({conflict_list}) DO UPDATE SET {updates}
+    ''')
+    upserted = cursor.rowcount
+    cursor.execute(f'TRUNCATE {stage}')
+    return upserted
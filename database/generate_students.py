@@ -1,9 +1,12 @@
 import os
 import sys
 import psycopg2
-from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
 import random
+from collections import Counter
+from itertools import chain, repeat
+
+from bulk_copy import copy_upsert
 
 MAJORS = [
     'Computer Science',
@@ -71,6 +74,10 @@ OFFICER_TITLES = {
     'officer': 'remaining'
 }
 
+# Single generator for the whole run, used through bound methods in the hot
+# loops. Set STUDENT_SEED to generate the same dataset again.
+_rng = random.Random(os.getenv('STUDENT_SEED'))
+
 
 def get_db_connection():
     '''
@@ -119,7 +126,7 @@ def generate_student_id():
     Returns:
         str: Student ID
     '''
-    return '1' + ''.join([str(random.randint(0, 9)) for _ in range(9)])
+    return f'1{_rng.randrange(10 ** 9):09d}'
 
 
 def generate_students(count):
@@ -132,32 +139,51 @@ def generate_students(count):
     Returns:
         list: List of student tuples (student_id, name, email, major, year)
     '''
-    students = []
-    used_ids = set()
-    used_emails = set()
+    # Draw each attribute for every student in one call rather than once
+    # per student. Sampling the 9-digit suffixes without replacement makes
+    # the IDs unique up front, so no retry loop is needed for them.
+    student_ids = [f'1{n:09d}' for n in _rng.sample(range(10 ** 9), count)]
+    first_names = _rng.choices(FIRST_NAMES, k=count)
+    last_names = _rng.choices(LAST_NAMES, k=count)
+    majors = _rng.choices(MAJORS, k=count)
+    years = _rng.choices(range(1, 6), k=count)
+
+    emails = [generate_email(first_name, last_name, student_id)
+              for first_name, last_name, student_id in zip(first_names, last_names, student_ids)]
+
+    # Emails only collide when two students share a name and the last two ID
+    # digits, so find the duplicates once and redraw IDs just for those,
+    # keeping the first student with each address
+    email_counts = Counter(emails)
+    used_ids = set(student_ids)
+    used_emails = set(email_counts)
+    kept = set()
+
+    for i, email in enumerate(emails):
+        if email_counts[email] == 1:
+            continue
+        if email not in kept:
+            kept.add(email)
+            continue
 
-    for i in range(count):
         while True:
             student_id = generate_student_id()
-            if student_id not in used_ids:
-                used_ids.add(student_id)
-                break
-
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        full_name = f"{first_name} {last_name}"
-
-        while True:
-            email = generate_email(first_name, last_name, student_id)
+            if student_id in used_ids:
+                continue
+            email = generate_email(first_names[i], last_names[i], student_id)
             if email not in used_emails:
-                used_emails.add(email)
                 break
-            student_id = generate_student_id()
 
-        major = random.choice(MAJORS)
-        year = random.randint(1, 5)
+        used_ids.add(student_id)
+        used_emails.add(email)
+        student_ids[i] = student_id
+        emails[i] = email
 
-        students.append((student_id, full_name, email, major, year))
+    students = [
+        (student_id, f"{first_name} {last_name}", email, major, year)
+        for student_id, first_name, last_name, email, major, year
+        in zip(student_ids, first_names, last_names, emails, majors, years)
+    ]
 
     return students
 
@@ -196,18 +222,10 @@ def insert_students(conn, students):
 
     cursor = conn.cursor()
 
-    insert_query = '''
-        INSERT INTO students (student_id, student_name, email, major, year)
-        VALUES %s
-        ON CONFLICT (student_id) DO UPDATE SET
-            student_name = EXCLUDED.student_name,
-            email = EXCLUDED.email,
-            major = EXCLUDED.major,
-            year = EXCLUDED.year
-    '''
-
     try:
-        execute_values(cursor, insert_query, students)
+        copy_upsert(cursor, 'students',
+                    ('student_id', 'student_name', 'email', 'major', 'year'), students,
+                    ('student_id',), ('student_name', 'email', 'major', 'year'), copy_format='csv')
         conn.commit()
         print(f'✓ Inserted/updated {len(students)} students')
         return len(students)
@@ -236,33 +254,36 @@ def assign_students_to_organizations(conn, student_ids, org_ids):
     memberships = []
     org_members = {org_id: [] for org_id in org_ids}
 
+    # Every join date falls in the last 1460 days, so build those dates once
+    # and draw each org's join dates and active flags in one call apiece
+    today = datetime.now().date()
+    join_dates = [today - timedelta(days=days_ago) for days_ago in range(1461)]
+
+    # sample() keeps nothing between calls, so pass it one immutable
+    # population (and its size) built once rather than the caller's list
+    population = tuple(student_ids)
+    population_size = len(population)
+
+    randint, sample, choices = _rng.randint, _rng.sample, _rng.choices
+
     # Assign students to organizations
     for org_id in org_ids:
-        num_members = random.randint(200, 1500)
+        num_members = randint(200, 1500)
 
-        num_members = min(num_members, len(student_ids))
+        num_members = min(num_members, population_size)
 
-        members = random.sample(student_ids, num_members)
+        members = sample(population, num_members)
         org_members[org_id] = members
 
-        for student_id in members:
-            days_ago = random.randint(0, 1460)
-            join_date = datetime.now() - timedelta(days=days_ago)
-
-            is_active = random.random() < 0.95
+        member_join_dates = choices(join_dates, k=num_members)
+        member_active = choices((True, False), weights=(95, 5), k=num_members)
 
-            memberships.append((student_id, org_id, join_date.date(), is_active))
-
-    insert_query = '''
-        INSERT INTO student_organizations (student_id, org_id, join_date, is_active)
-        VALUES %s
-        ON CONFLICT (student_id, org_id) DO UPDATE SET
-            join_date = EXCLUDED.join_date,
-            is_active = EXCLUDED.is_active
-    '''
+        memberships.extend(zip(members, repeat(org_id), member_join_dates, member_active))
 
     try:
-        execute_values(cursor, insert_query, memberships)
+        copy_upsert(cursor, 'student_organizations',
+                    ('student_id', 'org_id', 'join_date', 'is_active'), memberships,
+                    ('student_id', 'org_id'), ('join_date', 'is_active'), copy_format='csv')
         conn.commit()
         print(f'✓ Created {len(memberships)} student-organization memberships')
     except Exception as e:
@@ -292,16 +313,28 @@ def assign_officers(conn, org_members):
     '''
     cursor = conn.cursor()
     officer_assignments = []
-    student_officer_count = {}
+    student_officer_count = Counter()
+    # Students already holding the maximum number of positions. While this
+    # is empty (the usual case) every member is eligible and no filtering
+    # pass over the member list is needed.
+    maxed_students = set()
+
+    # Titles handed out in order to each org's selected officers; anyone
+    # past the named positions becomes a generic 'officer'
+    named_titles = [title for title, count in OFFICER_TITLES.items()
+                    if count != 'remaining' for _ in range(count)]
 
     for org_id, members in org_members.items():
         if not members:
             continue
 
-        num_officers = random.randint(6, 15)
+        num_officers = _rng.randint(6, 15)
         num_officers = min(num_officers, len(members))
 
-        eligible_members = [m for m in members if student_officer_count.get(m, 0) < 3]
+        if maxed_students:
+            eligible_members = [m for m in members if m not in maxed_students]
+        else:
+            eligible_members = members
 
         if len(eligible_members) < num_officers:
             num_officers = len(eligible_members)
@@ -309,32 +342,19 @@ def assign_officers(conn, org_members):
         if num_officers == 0:
             continue
 
-        selected_officers = random.sample(eligible_members, num_officers)
-
-        officer_idx = 0
-        for title, count in OFFICER_TITLES.items():
-            if count == 'remaining':
-                for i in range(officer_idx, len(selected_officers)):
-                    student_id = selected_officers[i]
-                    officer_assignments.append((student_id, org_id, 'officer'))
-                    student_officer_count[student_id] = student_officer_count.get(student_id, 0) + 1
-            else:
-                for _ in range(count):
-                    if officer_idx < len(selected_officers):
-                        student_id = selected_officers[officer_idx]
-                        officer_assignments.append((student_id, org_id, title))
-                        student_officer_count[student_id] = student_officer_count.get(student_id, 0) + 1
-                        officer_idx += 1
-
-    insert_query = '''
-        INSERT INTO student_officers (student_id, org_id, officer_title)
-        VALUES %s
-        ON CONFLICT (student_id, org_id) DO UPDATE SET
-            officer_title = EXCLUDED.officer_title
-    '''
+        selected_officers = _rng.sample(eligible_members, num_officers)
+        titles = chain(named_titles, repeat('officer'))
+
+        officer_assignments.extend(
+            (student_id, org_id, title) for student_id, title in zip(selected_officers, titles)
+        )
+        student_officer_count.update(selected_officers)
+        maxed_students.update(sid for sid in selected_officers if student_officer_count[sid] >= 3)
 
     try:
-        execute_values(cursor, insert_query, officer_assignments)
+        copy_upsert(cursor, 'student_officers',
+                    ('student_id', 'org_id', 'officer_title'), officer_assignments,
+                    ('student_id', 'org_id'), ('officer_title',), copy_format='csv')
         conn.commit()
         print(f'✓ Created {len(officer_assignments)} officer positions')
 
@@ -363,49 +383,57 @@ def get_database_stats(conn):
     Returns:
         dict: Dictionary with database statistics
     '''
+    # All counts and breakdowns in one round trip; each breakdown comes back
+    # as a JSON array of [value, count] pairs, which unpack like row tuples
     cursor = conn.cursor()
-    stats = {}
-
-    cursor.execute('SELECT COUNT(*) FROM students')
-    stats['students'] = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM student_organizations')
-    stats['memberships'] = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM student_officers')
-    stats['officers'] = cursor.fetchone()[0]
-
-    cursor.execute('''
-        SELECT COUNT(DISTINCT org_id)
-        FROM student_organizations
-    ''')
-    stats['orgs_with_members'] = cursor.fetchone()[0]
-
-    cursor.execute('''
-        SELECT major, COUNT(*) as count
-        FROM students
-        WHERE major IS NOT NULL
-        GROUP BY major
-        ORDER BY count DESC
-        LIMIT 5
-    ''')
-    stats['top_majors'] = cursor.fetchall()
-
-    cursor.execute('''
-        SELECT year, COUNT(*) as count
-        FROM students
-        GROUP BY year
-        ORDER BY year
-    ''')
-    stats['students_by_year'] = cursor.fetchall()
-
     cursor.execute('''
-        SELECT officer_title, COUNT(*) as count
-        FROM student_officers
-        GROUP BY officer_title
-        ORDER BY count DESC
+        SELECT
+            (SELECT COUNT(*) FROM students),
+            (SELECT COUNT(*) FROM student_organizations),
+            (SELECT COUNT(*) FROM student_officers),
+            (SELECT COUNT(DISTINCT org_id) FROM student_organizations),
+            (
+                SELECT COALESCE(json_agg(json_build_array(major, count)), '[]'::json)
+                FROM (
+                    SELECT major, COUNT(*) as count
+                    FROM students
+                    WHERE major IS NOT NULL
+                    GROUP BY major
+                    ORDER BY count DESC
+                    LIMIT 5
+                ) m
+            ),
+            (
+                SELECT COALESCE(json_agg(json_build_array(year, count)), '[]'::json)
+                FROM (
+                    SELECT year, COUNT(*) as count
+                    FROM students
+                    GROUP BY year
+                    ORDER BY year
+                ) y
+            ),
+            (
+                SELECT COALESCE(json_agg(json_build_array(officer_title, count)), '[]'::json)
+                FROM (
+                    SELECT officer_title, COUNT(*) as count
+                    FROM student_officers
+                    GROUP BY officer_title
+                    ORDER BY count DESC
+                ) t
+            )
     ''')
-    stats['officer_titles'] = cursor.fetchall()
+    (students, memberships, officers, orgs_with_members,
+     top_majors, students_by_year, officer_titles) = cursor.fetchone()
+
+    stats = {
+        'students': students,
+        'memberships': memberships,
+        'officers': officers,
+        'orgs_with_members': orgs_with_members,
+        'top_majors': top_majors,
+        'students_by_year': students_by_year,
+        'officer_titles': officer_titles
+    }
 
     cursor.close()
     return stats
@@ -43,6 +43,16 @@ CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);
 CREATE INDEX IF NOT EXISTS idx_events_name ON events(event_name);
 CREATE INDEX IF NOT EXISTS idx_events_start_datetime ON events(event_start_datetime);
 CREATE INDEX IF NOT EXISTS idx_events_event_type ON events(event_type);
+-- Matches the events list ORDER BY so pages are read in index order
+CREATE INDEX IF NOT EXISTS idx_events_start_id ON events(event_start_datetime DESC NULLS LAST, event_id);
+-- Equality filter followed by the list ORDER BY, for filtered pages
+CREATE INDEX IF NOT EXISTS idx_events_type_start_id ON events(event_type, event_start_datetime DESC NULLS LAST, event_id);
+CREATE INDEX IF NOT EXISTS idx_events_category_start_id ON events(category, event_start_datetime DESC NULLS LAST, event_id);
+CREATE INDEX IF NOT EXISTS idx_events_org_start_id ON events(org_id, event_start_datetime DESC NULLS LAST, event_id);
+
+-- Trigram index so substring search (event_name ILIKE '%term%') can use an index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_events_name_trgm ON events USING GIN (event_name gin_trgm_ops);
 
 -- Create a function to update the updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -3,10 +3,98 @@ import os
 import sys
 import re
 import psycopg2
-from psycopg2.extras import execute_values
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from html import unescape
 
+from bulk_copy import copy_upsert
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used when orjson is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # stream_events falls back to loading the whole file
+    ijson = None
+
+
+# Patterns used by parse_datetime/parse_location, compiled once at import
+# instead of being looked up in re's cache on every event
+_TAG_RE = re.compile(r'<[^>]+>')
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']')
+_ZOOM_RE = re.compile(r'\s*zoom\s+link\s*', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# One pass over the date text covers all three layouts:
+#   "Mon, Nov 3, 2025 5:30 PM"                            (start only)
+#   "Mon, Nov 3, 2025 5:30 PM – 7:30 PM"                  (same day)
+#   "Thu, Sep 4, 2025 1:00 PM – Thu, Dec 4, 2025 2:30 PM" (multiple days)
+_DATE_PATTERN = r'[A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4}'
+_TIME_PATTERN = r'\d+:\d+\s+[AP]M'
+_DATETIME_RE = re.compile(
+    rf'(?P<date>{_DATE_PATTERN})\s+(?P<start>{_TIME_PATTERN})'
+    rf'(?:\s+[-–—]\s+(?:(?P<end_date>{_DATE_PATTERN})\s+)?(?P<end>{_TIME_PATTERN}))?'
+)
+
+_DATETIME_FMT = '%a, %b %d, %Y %I:%M %p'
+
+_MONTHS = {name: number for number, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+_WEEKDAYS = frozenset(('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'))
+
+
+def _to_datetime(date_part, time_part):
+    '''
+    Build a datetime from a matched date and time such as "Mon, Nov 3, 2025"
+    and "5:30 PM", equivalent to strptime with _DATETIME_FMT.
+
+    The usual shape is assembled directly from its fields, which is several
+    times faster than strptime; anything else goes through strptime so
+    unusual or invalid values behave exactly as before.
+
+    Args:
+        date_part (str): Date text matched by _DATE_PATTERN (single-spaced)
+        time_part (str): Time text matched by _TIME_PATTERN (single-spaced)
+
+    Returns:
+        datetime: Parsed datetime
+
+    Raises:
+        ValueError: If the date or time is not valid
+    '''
+    try:
+        weekday, month_day, year = date_part.split(', ')
+        month_name, day = month_day.split(' ')
+        clock, meridiem = time_part.split(' ')
+        hour, minute = clock.split(':')
+        if (weekday.lower() in _WEEKDAYS and len(day) <= 2
+                and len(hour) <= 2 and len(minute) <= 2):
+            day, hour, minute = int(day), int(hour), int(minute)
+            if day >= 1 and 1 <= hour <= 12 and minute < 60:
+                hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+                return datetime(int(year), _MONTHS[month_name.lower()], day, hour, minute)
+    except (KeyError, ValueError):
+        pass
+    return datetime.strptime(f'{date_part} {time_part}', _DATETIME_FMT)
+
+# Batches at least this large are parsed in a process pool by insert_events
+PARALLEL_PARSE_MIN_EVENTS = 2000
+
+# Number of events insert_events parses and upserts at a time
+EVENT_BATCH_SIZE = 5000
+
+# Columns written by insert_events, in the order of each row tuple
+EVENT_COLUMNS = (
+    'event_id', 'event_uid', 'event_name', 'event_description',
+    'event_start_datetime', 'event_end_datetime', 'original_date_string',
+    'category', 'location_text', 'online_link', 'event_type', 'org_id',
+    'attendees', 'picture_url', 'price_range', 'button_label', 'badges',
+    'event_url', 'timezone', 'aria_details'
+)
+
 
 def get_db_connection():
     '''
@@ -37,8 +125,9 @@ def load_json_data(json_file_path):
         list: List of event dictionaries
     '''
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         print(f'✓ Loaded {len(data)} events from {json_file_path}')
         return data
     except Exception as e:
@@ -46,6 +135,31 @@ def load_json_data(json_file_path):
         sys.exit(1)
 
 
+def stream_events(json_file_path):
+    '''
+    Yield events from the JSON file one at a time.
+
+    With ijson the file is parsed incrementally, so only the event being
+    yielded is held in memory; without it the whole file is loaded first.
+
+    Args:
+        json_file_path (str): Path to the JSON file
+
+    Yields:
+        dict: Event dictionary
+    '''
+    if ijson is None:
+        yield from load_json_data(json_file_path)
+        return
+
+    try:
+        with open(json_file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    except ijson.JSONError as e:
+        print(f'✗ Error loading JSON file: {e}')
+        sys.exit(1)
+
+
 def parse_datetime(date_string):
     '''
     Parse datetime from HTML date string.
@@ -62,56 +176,26 @@ def parse_datetime(date_string):
 
     original = date_string
 
-    text = re.sub(r'<[^>]+>', ' ', date_string)
-    text = unescape(text)
-    text = ' '.join(text.split())
+    text = _TAG_RE.sub(' ', date_string)
+    if '&' in text:
+        text = unescape(text)
+    text = _WS_RE.sub(' ', text).strip()
 
     start_dt = None
     end_dt = None
 
     try:
-        # Pattern 1: "Day, Month Date, Year Time – Time"
-        # Example: "Mon, Nov 3, 2025 5:30 PM – 7:30 PM"
-        pattern1 = r'([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4})\s+(\d+:\d+\s+[AP]M)\s+[-–—]\s+(\d+:\d+\s+[AP]M)'
-        match = re.search(pattern1, text)
+        match = _DATETIME_RE.search(text)
 
         if match:
-            date_part = match.group(1)
-            start_time = match.group(2)
-            end_time = match.group(3)
+            date_part = match.group('date')
+            start_dt = _to_datetime(date_part, match.group('start'))
 
-            start_str = f"{date_part} {start_time}"
-            start_dt = datetime.strptime(start_str, "%a, %b %d, %Y %I:%M %p")
-
-            end_str = f"{date_part} {end_time}"
-            end_dt = datetime.strptime(end_str, "%a, %b %d, %Y %I:%M %p")
-        else:
-            # Pattern 2: Date ranges across multiple days
-            # Example: "Thu, Sep 4, 2025 1:00 PM – Thu, Dec 4, 2025 2:30 PM"
-            pattern2 = r'([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4})\s+(\d+:\d+\s+[AP]M)\s+[-–—]\s+([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4})\s+(\d+:\d+\s+[AP]M)'
-            match2 = re.search(pattern2, text)
-
-            if match2:
-                start_date = match2.group(1)
-                start_time = match2.group(2)
-                end_date = match2.group(3)
-                end_time = match2.group(4)
-
-                start_str = f"{start_date} {start_time}"
-                start_dt = datetime.strptime(start_str, "%a, %b %d, %Y %I:%M %p")
-
-                end_str = f"{end_date} {end_time}"
-                end_dt = datetime.strptime(end_str, "%a, %b %d, %Y %I:%M %p")
-            else:
-                # Pattern 3: Just date and start time, no end time
-                pattern3 = r'([A-Za-z]+,\s+[A-Za-z]+\s+\d+,\s+\d{4})\s+(\d+:\d+\s+[AP]M)'
-                match3 = re.search(pattern3, text)
-
-                if match3:
-                    date_part = match3.group(1)
-                    start_time = match3.group(2)
-                    start_str = f"{date_part} {start_time}"
-                    start_dt = datetime.strptime(start_str, "%a, %b %d, %Y %I:%M %p")
+            end_time = match.group('end')
+            if end_time:
+                # Without an end date the event ends on its start date
+                end_date = match.group('end_date') or date_part
+                end_dt = _to_datetime(end_date, end_time)
 
     except Exception as e:
         # If parsing fails, return None but keep original string
@@ -139,18 +223,22 @@ def parse_location(location_string):
 
     original = location_string
 
-    # Extract URLs from href attributes
-    url_pattern = r'href=["\']([^"\']+)["\']'
-    urls = re.findall(url_pattern, location_string)
-    online_link = urls[0] if urls else None
+    # Most locations are plain text, so the regexes only run when the
+    # markup they look for is present at all; only the first link is used
+    online_link = None
+    if 'href' in location_string:
+        match = _HREF_RE.search(location_string)
+        if match:
+            online_link = match.group(1)
 
     # Remove HTML tags
-    location_text = re.sub(r'<[^>]+>', ' ', location_string)
-    location_text = unescape(location_text)
-    location_text = ' '.join(location_text.split()).strip()
+    location_text = _TAG_RE.sub(' ', location_string) if '<' in location_string else location_string
+    if '&' in location_text:
+        location_text = unescape(location_text)
+    location_text = _WS_RE.sub(' ', location_text).strip()
 
     # Remove text artifacts
-    location_text = re.sub(r'\s*zoom\s+link\s*', '', location_text, flags=re.IGNORECASE)
+    location_text = _ZOOM_RE.sub('', location_text)
     location_text = location_text.strip()
 
     # Determine event type
@@ -178,7 +266,7 @@ def extract_organizations(events):
     Extract unique organizations from events data.
 
     Args:
-        events (list): List of event dictionaries
+        events (iterable): Event dictionaries
 
     Returns:
         list: List of unique organization dictionaries
@@ -197,12 +285,12 @@ def extract_organizations(events):
     return list(orgs_dict.values())
 
 
-def insert_organizations(conn, organizations):
+def insert_organizations(cursor, organizations):
     '''
     Insert organizations into the database.
 
     Args:
-        conn: Database connection
+        cursor: Database cursor
         organizations (list): List of organization dictionaries
 
     Returns:
@@ -212,16 +300,15 @@ def insert_organizations(conn, organizations):
         print('No organizations to insert')
         return 0
 
-    cursor = conn.cursor()
-
-    org_values = [
-        (org['org_id'], org['org_login'], org['org_name'])
-        for org in organizations
-    ]
+    # One array per column; unnest zips them back into rows server-side, so
+    # the whole batch is a single statement that still supports ON CONFLICT
+    org_ids = [org['org_id'] for org in organizations]
+    org_logins = [org['org_login'] for org in organizations]
+    org_names = [org['org_name'] for org in organizations]
 
     insert_query = '''
         INSERT INTO organizations (org_id, org_login, org_name)
-        VALUES %s
+        SELECT * FROM unnest(%s::varchar[], %s::varchar[], %s::varchar[])
         ON CONFLICT (org_id) DO UPDATE SET
             org_login = EXCLUDED.org_login,
             org_name = EXCLUDED.org_name,
@@ -229,174 +316,244 @@ def insert_organizations(conn, organizations):
     '''
 
     try:
-        execute_values(cursor, insert_query, org_values)
-        conn.commit()
+        cursor.execute(insert_query, (org_ids, org_logins, org_names))
         print(f'✓ Inserted/updated {len(organizations)} organizations')
         return len(organizations)
     except Exception as e:
-        conn.rollback()
         print(f'✗ Error inserting organizations: {e}')
-        return 0
-    finally:
-        cursor.close()
+        raise
 
 
-def insert_events(conn, events):
+def _parse_attendees(value):
     '''
-    Insert events into the database with parsed datetime and location.
+    Coerce a scraped attendee count to an int, 0 if unusable.
+
+    Only non-negative ints and all-digit strings are accepted, as with the
+    earlier str(value).isdigit() check; signs, whitespace, underscores and
+    floats give 0.
 
     Args:
-        conn: Database connection
-        events (list): List of event dictionaries
+        value: Raw attendees value (usually an all-digit string)
 
     Returns:
-        int: Number of events inserted
+        int: Attendee count
     '''
-    if not events:
-        print('No events to insert')
-        return 0
+    if type(value) is int:
+        return value if value > 0 else 0
+    if isinstance(value, str) and value.isdigit():
+        try:
+            return int(value)
+        except ValueError:  # Unicode digits such as '²' that int() rejects
+            return 0
+    return 0
 
-    cursor = conn.cursor()
 
-    seen_ids = set()
-    unique_events = []
-    duplicates = 0
-    parse_warnings = 0
+def event_row(event):
+    '''
+    Build the events table row for one scraped event.
 
-    for event in events:
-        event_id = event.get('event_id')
-        if event_id and event_id not in seen_ids:
-            seen_ids.add(event_id)
-            unique_events.append(event)
-        else:
-            duplicates += 1
-
-    if duplicates > 0:
-        print(f'⚠ Removed {duplicates} duplicate events from batch')
-
-    event_values = []
-    for event in unique_events:
-        # Parse datetime
-        start_dt, end_dt, original_date = parse_datetime(event.get('dates'))
-
-        # Parse location
-        location_text, online_link, event_type = parse_location(event.get('location'))
-
-        event_values.append((
-            event.get('event_id'),
-            event.get('event_uid'),
-            event.get('name'),
-            event.get('description'),  # May be None in current data
-            start_dt,
-            end_dt,
-            original_date,
-            event.get('category'),
-            location_text,
-            online_link,
-            event_type,
-            event.get('club_id'),  # Will map to org_id in DB
-            int(event.get('attendees', 0)) if event.get('attendees') and str(event.get('attendees')).isdigit() else 0,
-            event.get('picture_url'),
-            event.get('price_range'),
-            event.get('button_label'),
-            event.get('badges'),
-            event.get('event_url'),
-            event.get('timezone'),
-            event.get('aria_details')
-        ))
+    Args:
+        event (dict): Scraped event dictionary
 
-    insert_query = '''
-        INSERT INTO events (
-            event_id, event_uid, event_name, event_description,
-            event_start_datetime, event_end_datetime, original_date_string,
-            category, location_text, online_link, event_type, org_id,
-            attendees, picture_url, price_range, button_label, badges,
-            event_url, timezone, aria_details
-        )
-        VALUES %s
-        ON CONFLICT (event_id) DO UPDATE SET
-            event_uid = EXCLUDED.event_uid,
-            event_name = EXCLUDED.event_name,
-            event_description = EXCLUDED.event_description,
-            event_start_datetime = EXCLUDED.event_start_datetime,
-            event_end_datetime = EXCLUDED.event_end_datetime,
-            original_date_string = EXCLUDED.original_date_string,
-            category = EXCLUDED.category,
-            location_text = EXCLUDED.location_text,
-            online_link = EXCLUDED.online_link,
-            event_type = EXCLUDED.event_type,
-            org_id = EXCLUDED.org_id,
-            attendees = EXCLUDED.attendees,
-            picture_url = EXCLUDED.picture_url,
-            price_range = EXCLUDED.price_range,
-            button_label = EXCLUDED.button_label,
-            badges = EXCLUDED.badges,
-            event_url = EXCLUDED.event_url,
-            timezone = EXCLUDED.timezone,
-            aria_details = EXCLUDED.aria_details,
-            updated_at = CURRENT_TIMESTAMP
+    Returns:
+        tuple: Values in EVENT_COLUMNS order
     '''
+    # Bound once; every column below is a lookup on the same dict
+    get = event.get
+
+    # Parse datetime
+    start_dt, end_dt, original_date = parse_datetime(get('dates'))
+
+    # Parse location
+    location_text, online_link, event_type = parse_location(get('location'))
+
+    return (
+        get('event_id'),
+        get('event_uid'),
+        get('name'),
+        get('description'),  # May be None in current data
+        start_dt,
+        end_dt,
+        original_date,
+        get('category'),
+        location_text,
+        online_link,
+        event_type,
+        get('club_id'),  # Will map to org_id in DB
+        _parse_attendees(get('attendees')),
+        get('picture_url'),
+        get('price_range'),
+        get('button_label'),
+        get('badges'),
+        get('event_url'),
+        get('timezone'),
+        get('aria_details')
+    )
+
+
+def _batches(iterable, size):
+    '''Yield successive lists of up to size items from iterable.'''
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def insert_events(cursor, events):
+    '''
+    Insert events into the database with parsed datetime and location.
+
+    Events are consumed lazily and upserted EVENT_BATCH_SIZE at a time, so
+    memory use is bounded by the batch rather than the whole file. Batches
+    are not committed here; the caller's transaction covers all of them.
+
+    Args:
+        cursor: Database cursor
+        events (iterable): Event dictionaries
+
+    Returns:
+        int: Number of events inserted
+    '''
+    workers = os.cpu_count() or 1
+    executor = None
+    seen_ids = set()
+    total = 0
 
     try:
-        execute_values(cursor, insert_query, event_values)
-        conn.commit()
-        print(f'✓ Inserted/updated {len(unique_events)} events')
-        return len(unique_events)
+        for batch in _batches(events, EVENT_BATCH_SIZE):
+            total += len(batch)
+
+            # Events without an ID are dropped. Repeats are left to the
+            # upsert, which keeps the last copy; the IDs are only collected
+            # to report how many there were.
+            events_with_id = [event for event in batch if event.get('event_id')]
+            seen_ids.update(event['event_id'] for event in events_with_id)
+
+            # Parsing is CPU-bound and independent per event, so large batches
+            # are spread across processes (one pool shared by every batch);
+            # small ones aren't worth the worker start-up
+            if len(events_with_id) < PARALLEL_PARSE_MIN_EVENTS:
+                event_values = [event_row(event) for event in events_with_id]
+            else:
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                chunksize = max(1, len(events_with_id) // (4 * workers))
+                event_values = list(executor.map(event_row, events_with_id, chunksize=chunksize))
+
+            copy_upsert(cursor, 'events', EVENT_COLUMNS, event_values,
+                        ('event_id',), EVENT_COLUMNS[1:], ('updated_at = CURRENT_TIMESTAMP',))
+
+        if not total:
+            print('No events to insert')
+            return 0
+
+        duplicates = total - len(seen_ids)
+        if duplicates > 0:
+            print(f'⚠ Skipped {duplicates} duplicate events')
+
+        print(f'✓ Inserted/updated {len(seen_ids)} events')
+        return len(seen_ids)
     except Exception as e:
-        conn.rollback()
         print(f'✗ Error inserting events: {e}')
-        return 0
+        raise
     finally:
-        cursor.close()
+        if executor is not None:
+            executor.shutdown()
 
 
-def get_database_stats(conn):
+def get_database_stats(cursor):
     '''
     Get statistics about the data in the database.
 
     Args:
-        conn: Database connection
+        cursor: Database cursor
 
     Returns:
         dict: Dictionary with database statistics
     '''
-    cursor = conn.cursor()
+    # Breakdowns come back as [category or type, count] JSON pairs
+    cursor.execute('''
+        SELECT
+            (SELECT COUNT(*) FROM organizations),
+            (SELECT COUNT(*) FROM events),
+            (
+                SELECT COALESCE(json_agg(json_build_array(category, count)), '[]'::json)
+                FROM (
+                    SELECT category, COUNT(*) as count
+                    FROM events
+                    WHERE category IS NOT NULL
+                    GROUP BY category
+                    ORDER BY count DESC
+                ) c
+            ),
+            (
+                SELECT COALESCE(json_agg(json_build_array(event_type, count)), '[]'::json)
+                FROM (
+                    SELECT event_type, COUNT(*) as count
+                    FROM events
+                    WHERE event_type IS NOT NULL
+                    GROUP BY event_type
+                    ORDER BY count DESC
+                ) t
+            )
+    ''')
+    organizations, events, categories, event_types = cursor.fetchone()
 
-    stats = {}
+    return {
+        'organizations': organizations,
+        'events': events,
+        'categories': categories,
+        'event_types': event_types
+    }
 
-    cursor.execute('SELECT COUNT(*) FROM organizations')
-    stats['organizations'] = cursor.fetchone()[0]
 
-    cursor.execute('SELECT COUNT(*) FROM events')
-    stats['events'] = cursor.fetchone()[0]
+def drop_secondary_indexes(cursor, table):
+    '''
+    Drop a table's non-unique indexes, returning the statements to rebuild them.
 
-    cursor.execute('''
-        SELECT category, COUNT(*)
-        FROM events
-        WHERE category IS NOT NULL
-        GROUP BY category
-        ORDER BY COUNT(*) DESC
-    ''')
-    stats['categories'] = cursor.fetchall()
+    Primary key and unique indexes are kept, since ON CONFLICT relies on them.
+
+    Args:
+        cursor: Database cursor
+        table (str): Table name
 
+    Returns:
+        list: CREATE INDEX statements for the dropped indexes
+    '''
     cursor.execute('''
-        SELECT event_type, COUNT(*)
-        FROM events
-        WHERE event_type IS NOT NULL
-        GROUP BY event_type
-        ORDER BY COUNT(*) DESC
-    ''')
-    stats['event_types'] = cursor.fetchall()
+        SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+        FROM pg_index
+        WHERE indrelid = %s::regclass
+          AND NOT indisprimary
+          AND NOT indisunique
+    ''', (table,))
+    indexes = cursor.fetchall()
 
-    cursor.close()
-    return stats
+    for index_name, _ in indexes:
+        cursor.execute(f'DROP INDEX {index_name}')
+
+    return [definition for _, definition in indexes]
 
 
 def main():
-    '''Main function to load data into database.'''
+    '''
+    Main function to load data into database.
 
-    if len(sys.argv) > 1:
-        json_file_path = sys.argv[1]
+    Usage: load_data.py [--bulk] [json_file_path]
+
+    --bulk is meant for loading into an empty or near-empty database: the
+    events table's secondary indexes are dropped and rebuilt once after the
+    load, and foreign key triggers are skipped (organizations are always
+    inserted before their events). Both happen inside the load transaction.
+    '''
+    args = sys.argv[1:]
+    bulk = '--bulk' in args
+    args = [arg for arg in args if arg != '--bulk']
+
+    if args:
+        json_file_path = args[0]
     else:
         docker_path = '/data/scraped_events.json'
         if os.path.exists(docker_path):
@@ -415,19 +572,51 @@ def main():
     print('\nLoading ASU Events data into PostgreSQL...')
     print('='*60)
 
-    events = load_json_data(json_file_path)
-
     conn = get_db_connection()
 
     try:
-        organizations = extract_organizations(events)
-        orgs_inserted = insert_organizations(conn, organizations)
-
-        events_inserted = insert_events(conn, events)
+        # One cursor serves the whole load and the statistics query
+        with conn.cursor() as cursor:
+            # Load organizations and events in one transaction: a failure
+            # leaves the database untouched, and there is a single commit at
+            # the end. synchronous_commit is off for just this transaction, so
+            # that commit doesn't wait on the WAL flush; a crash right after it
+            # could lose the load, which is simply rerun.
+            with conn:
+                cursor.execute('SET LOCAL synchronous_commit = off')
+
+                index_definitions = []
+                if bulk:
+                    # Requires superuser, as the docker setup's postgres user is
+                    cursor.execute('SET LOCAL session_replication_role = replica')
+                    index_definitions = drop_secondary_indexes(cursor, 'events')
+                    print(f'✓ Bulk mode: dropped {len(index_definitions)} event indexes')
+
+                # Organizations must exist before the events that reference
+                # them. With ijson the file is streamed twice, so only the
+                # organizations, not every event, are held in memory; without
+                # it the file is loaded whole anyway, so it is read just once.
+                if ijson is None:
+                    events = load_json_data(json_file_path)
+                    org_source = event_source = events
+                else:
+                    org_source = stream_events(json_file_path)
+                    event_source = stream_events(json_file_path)
+
+                organizations = extract_organizations(org_source)
+                orgs_inserted = insert_organizations(cursor, organizations)
+
+                events_inserted = insert_events(cursor, event_source)
+
+                for definition in index_definitions:
+                    cursor.execute(definition)
+                if index_definitions:
+                    print(f'✓ Rebuilt {len(index_definitions)} event indexes')
+
+            stats = get_database_stats(cursor)
 
         print('\n' + '='*60)
         print('DATABASE STATISTICS:')
-        stats = get_database_stats(conn)
         print(f'  Total organizations: {stats["organizations"]}')
         print(f'  Total events: {stats["events"]}')
 
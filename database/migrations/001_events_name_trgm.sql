@@ -0,0 +1,7 @@
+-- Trigram index for event name search
+-- Lets the substring search in get_events_paginated (event_name ILIKE '%term%')
+-- use a bitmap index scan instead of a sequential scan of events
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_events_name_trgm ON events USING GIN (event_name gin_trgm_ops);
@@ -0,0 +1,8 @@
+-- Composite index matching the events list ORDER BY
+-- (event_start_datetime DESC NULLS LAST, event_id) so get_events_paginated
+-- and get_organization_details can read rows in order and stop at LIMIT
+-- instead of sorting every filtered row
+
+CREATE INDEX IF NOT EXISTS idx_events_start_id ON events (event_start_datetime DESC NULLS LAST, event_id);
+
+ANALYZE events;
@@ -0,0 +1,15 @@
+-- Composite indexes for the filtered events lists
+-- Each leads with an equality filter used by get_events_paginated
+-- (event_type, category, org_id) followed by the list ORDER BY
+-- (event_start_datetime DESC NULLS LAST, event_id), so a filtered page is
+-- read in order straight from the index and stops at LIMIT instead of
+-- collecting and sorting every matching row. The org_id variant also serves
+-- the events list in get_organization_details.
+
+CREATE INDEX IF NOT EXISTS idx_events_type_start_id ON events (event_type, event_start_datetime DESC NULLS LAST, event_id);
+
+CREATE INDEX IF NOT EXISTS idx_events_category_start_id ON events (category, event_start_datetime DESC NULLS LAST, event_id);
+
+CREATE INDEX IF NOT EXISTS idx_events_org_start_id ON events (org_id, event_start_datetime DESC NULLS LAST, event_id);
+
+ANALYZE events;
@@ -7,17 +7,39 @@ import requests
 import json
 import sys
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used when orjson is not installed
+    orjson = None
 
 
 class ASUEventsScraper:
-    def __init__(self, cookies):
+    # Cleaned field name -> API key, in the order parse_event emits them
+    _FIELDS = (
+        ('event_id', 'p1'), ('event_uid', 'p2'), ('name', 'p3'), ('dates', 'p4'),
+        ('category', 'p5'), ('location', 'p6'), ('club_id', 'p7'), ('club_login', 'p8'),
+        ('club_name', 'p9'), ('attendees', 'p10'), ('picture_url', 'p11'),
+        ('price_range', 'p12'), ('button_label', 'p13'), ('badges', 'p14'),
+        ('event_url', 'p18'), ('timezone', 'p28'), ('aria_details', 'p29'),
+    )
+    _FIELD_NAMES = tuple(name for name, _ in _FIELDS)
+    _API_KEYS = tuple(key for _, key in _FIELDS)
+    _project = staticmethod(itemgetter(*_API_KEYS))
+
+    def __init__(self, cookies, max_connections=8):
         '''
         Initialize the scraper with authentication cookies.
 
         Args:
             cookies (dict): Dictionary of cookies for authentication
+            max_connections (int): Size of the session's connection pool
         '''
         self.base_url = 'https://sundevilcentral.eoss.asu.edu/mobile_ws/v17/mobile_events_list'
         self.cookies = cookies
@@ -32,6 +54,15 @@ class ASUEventsScraper:
             'sec-fetch-site': 'same-origin'
         }
 
+        # One session for every page so TCP/TLS connections are kept alive
+        # and reused, with enough pooled connections for concurrent fetches
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.cookies.update(self.cookies)
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def fetch_events(self, range_start=0, limit=40):
         '''
         Fetch events from the API.
@@ -55,16 +86,16 @@ class ASUEventsScraper:
 
         try:
             print(f'Fetching events (range: {range_start}, limit: {limit})...')
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
-                headers=self.headers,
-                cookies=self.cookies,
                 timeout=30
             )
             response.raise_for_status()
 
-            data = response.json()
+            # orjson parses the body bytes directly, without decoding them to
+            # str first; its JSONDecodeError subclasses json's
+            data = orjson.loads(response.content) if orjson else response.json()
             print(f'✓ Successfully fetched {len(data)} items from API')
             return data
 
@@ -75,49 +106,65 @@ class ASUEventsScraper:
             print(f'✗ Error parsing JSON response: {e}')
             return []
 
-    def fetch_all_events(self, max_events=None):
+    def fetch_all_events(self, max_events=None, window=4):
         '''
         Fetch all events by paginating through the API.
 
+        Up to `window` pages are requested ahead of the one being processed,
+        so network round trips overlap; pages are still handled strictly in
+        order, and requests still in flight when pagination stops are
+        discarded.
+
         Args:
             max_events (int): Maximum number of events to fetch (None for all)
+            window (int): Number of page requests kept in flight
 
         Returns:
             list: List of all event objects
         '''
         all_events = []
-        range_start = 0
+        next_start = 0
         limit = 40
         consecutive_empty = 0
+        pending = deque()
 
-        while True:
-            events = self.fetch_events(range_start, limit)
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for _ in range(window):
+                pending.append(executor.submit(self.fetch_events, next_start, limit))
+                next_start += limit
 
-            if not events:
-                print('No more data returned from API')
-                break
+            while pending:
+                events = pending.popleft().result()
 
-            actual_events = [e for e in events if e.get('listingSeparator') != 'true']
+                if not events:
+                    print('No more data returned from API')
+                    break
 
-            if not actual_events:
-                consecutive_empty += 1
-                if consecutive_empty >= 3:
-                    print('No actual events in last 3 API calls, stopping pagination')
+                actual_events = [e for e in events if e.get('listingSeparator') != 'true']
+
+                if not actual_events:
+                    consecutive_empty += 1
+                    if consecutive_empty >= 3:
+                        print('No actual events in last 3 API calls, stopping pagination')
+                        break
+                else:
+                    consecutive_empty = 0
+                    all_events.extend(actual_events)
+                    print(f'  → Added {len(actual_events)} events. Total so far: {len(all_events)}')
+
+                if max_events and len(all_events) >= max_events:
+                    all_events = all_events[:max_events]
                     break
-            else:
-                consecutive_empty = 0
-                all_events.extend(actual_events)
-                print(f'  → Added {len(actual_events)} events. Total so far: {len(all_events)}')
 
-            if max_events and len(all_events) >= max_events:
-                all_events = all_events[:max_events]
-                break
+                if len(events) < limit and consecutive_empty > 0:
+                    print('API returned fewer items than requested, likely at end')
+                    break
 
-            if len(events) < limit and consecutive_empty > 0:
-                print('API returned fewer items than requested, likely at end')
-                break
+                pending.append(executor.submit(self.fetch_events, next_start, limit))
+                next_start += limit
 
-            range_start += limit
+            for future in pending:
+                future.cancel()
 
         return all_events
 
@@ -131,25 +178,17 @@ class ASUEventsScraper:
         Returns:
             dict: Cleaned event data
         '''
-        return {
-            'event_id': event_data.get('p1'),
-            'event_uid': event_data.get('p2'),
-            'name': event_data.get('p3'),
-            'dates': event_data.get('p4'),
-            'category': event_data.get('p5'),
-            'location': event_data.get('p6'),
-            'club_id': event_data.get('p7'),
-            'club_login': event_data.get('p8'),
-            'club_name': event_data.get('p9'),
-            'attendees': event_data.get('p10'),
-            'picture_url': event_data.get('p11'),
-            'price_range': event_data.get('p12'),
-            'button_label': event_data.get('p13'),
-            'badges': event_data.get('p14'),
-            'event_url': f"https://sundevilcentral.eoss.asu.edu{event_data.get('p18')}" if event_data.get('p18') else None,
-            'timezone': event_data.get('p28'),
-            'aria_details': event_data.get('p29'),
-        }
+        # All fields in one C-level call; events missing a key take the
+        # slower per-key path so absent fields still come out as None
+        try:
+            values = self._project(event_data)
+        except KeyError:
+            values = tuple(map(event_data.get, self._API_KEYS))
+
+        event = dict(zip(self._FIELD_NAMES, values))
+        path = event['event_url']
+        event['event_url'] = f'https://sundevilcentral.eoss.asu.edu{path}' if path else None
+        return event
 
     def save_events(self, events, output_file='events.json', parse=True):
         '''
@@ -169,8 +208,13 @@ class ASUEventsScraper:
                 os.makedirs(output_dir)
                 print(f'Created directory: {output_dir}')
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(events, f, indent=2, ensure_ascii=False)
+            if orjson:
+                # orjson writes UTF-8 without escaping, like ensure_ascii=False
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(events, f, indent=2, ensure_ascii=False)
 
             print(f'\n✓ Saved {len(events)} events to: {output_file}')
 
@@ -217,14 +261,23 @@ if __name__ == '__main__':
 
     output_file = sys.argv[1] if len(sys.argv) > 1 else default_output
 
+    # Pages requested concurrently; raise to scrape faster, lower if the API
+    # starts rejecting or throttling requests
+    concurrency_setting = os.getenv('SCRAPER_CONCURRENCY') or '4'
+    try:
+        concurrency = max(1, int(concurrency_setting))
+    except ValueError:
+        print(f'⚠ Warning: SCRAPER_CONCURRENCY must be a whole number, got {concurrency_setting!r}; using 4')
+        concurrency = 4
+
     cookies = parse_cookies(COOKIE_STRING)
 
-    scraper = ASUEventsScraper(cookies)
+    scraper = ASUEventsScraper(cookies, max_connections=max(8, concurrency))
 
     print('\nScraping ALL events from ASU Sun Devil Central...')
     print('='*60)
 
-    events = scraper.fetch_all_events()
+    events = scraper.fetch_all_events(window=concurrency)
 
     if events:
         scraper.save_events(events, output_file)